@@ -45,23 +45,30 @@ def execute_query_and_compare_results(
     if request_config.getoption("--store-reference-results"):
         duckdb_relation.write_parquet(f"{output_dir}/reference_results/{result_file_name}")
 
+    # Each fetch from the relation re-executes the reference query, so materialize it at most once and share
+    # the frame between the preview and the comparison.
+    duckdb_df = None
     if request_config.getoption("--show-reference-result-preview"):
-        duckdb_rows = duckdb_relation.fetchall()
-        show_result_preview(duckdb_relation.columns, duckdb_rows, preview_rows_count, "Reference", query_id)
+        duckdb_df = duckdb_relation.df()
+        print_result_preview(duckdb_df.head(preview_rows_count), len(duckdb_df), "Reference", query_id)
 
     if not request_config.getoption("--skip-reference-comparison"):
         engine_df = pd.DataFrame(query_engine_rows, columns=query_engine_columns)
-        duckdb_df = duckdb_relation.df()
+        if duckdb_df is None:
+            duckdb_df = duckdb_relation.df()
         compare_result_frames(engine_df, duckdb_df, query, query_engine_column_types)
 
 
 def show_result_preview(columns, rows, preview_rows_count, result_source, query_id):
+    preview_df = pd.DataFrame(rows[:preview_rows_count], columns=columns)
+    print_result_preview(preview_df, len(rows), result_source, query_id)
+
+
+def print_result_preview(preview_df, total_rows_count, result_source, query_id):
     start_line = f"\n{'-' * 50} {result_source} {query_id} Result Preview {'-' * 50}"
     print(start_line)
-    preview_rows_count = min(preview_rows_count, len(rows))
-    print(f"Showing {preview_rows_count} of {len(rows)} rows...\n")
-    df = pd.DataFrame(rows[:preview_rows_count], columns=columns)
-    print(df)
+    print(f"Showing {len(preview_df)} of {total_rows_count} rows...\n")
+    print(preview_df)
     print("-" * len(start_line))
 
 
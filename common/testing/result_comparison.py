@@ -10,6 +10,7 @@ parquet files). See compare_result_frames for full comparison semantics.
 """
 
 import datetime
+import functools
 import re
 import warnings
 from typing import Literal
@@ -34,6 +35,16 @@ ValidationStatus = Literal["passed", "failed", "expected-failure", "not-validate
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_query(query_sql: str) -> sqlglot.exp.Expression:
+    """
+    Parse query_sql with sqlglot, memoized by query text. ORDER BY and LIMIT
+    extraction both read the AST, so each distinct query is parsed once.
+    Callers must treat the returned AST as read-only.
+    """
+    return sqlglot.parse_one(query_sql)
+
+
 def get_orderby_col_indices(query_sql: str, expected_col_names: list[str]) -> tuple[list[int], list[bool]]:
     """
     Extract ORDER BY column positions and directions from SQL using sqlglot.
@@ -43,7 +54,7 @@ def get_orderby_col_indices(query_sql: str, expected_col_names: list[str]) -> tu
     ORDER BY expression is too complex to map to a result column (CASE,
     aggregate, etc.).
     """
-    expr = sqlglot.parse_one(query_sql)
+    expr = _parse_query(query_sql)
     order = next((e for e in expr.find_all(sqlglot.exp.Order)), None)
     if not order:
         return [], []
@@ -51,6 +62,11 @@ def get_orderby_col_indices(query_sql: str, expected_col_names: list[str]) -> tu
     sort_col_indices: list[int] = []
     ascending: list[bool] = []
 
+    # First position of each column name, matching list.index semantics.
+    col_positions: dict[str, int] = {}
+    for i, col_name in enumerate(expected_col_names):
+        col_positions.setdefault(col_name, i)
+
     for ordered in order.expressions:
         key = ordered.this
         is_desc = bool(ordered.args.get("desc"))
@@ -66,9 +82,7 @@ def get_orderby_col_indices(query_sql: str, expected_col_names: list[str]) -> tu
                 pass
 
         if resolved_idx is None and isinstance(key, sqlglot.exp.Column):
-            name = key.name
-            if name in expected_col_names:
-                resolved_idx = expected_col_names.index(name)
+            resolved_idx = col_positions.get(key.name)
 
         if resolved_idx is None:
             # Complex expression — skip ORDER BY handling for this query.
@@ -87,7 +101,7 @@ def get_orderby_col_indices(query_sql: str, expected_col_names: list[str]) -> tu
 def get_limit(query_sql: str) -> int | None:
     """Return the LIMIT value from SQL, or None if there is no LIMIT (or the
     LIMIT expression isn't a simple integer literal)."""
-    expr = sqlglot.parse_one(query_sql)
+    expr = _parse_query(query_sql)
     limit_node = next((e for e in expr.find_all(sqlglot.exp.Limit)), None)
     if limit_node is None:
         return None
@@ -470,10 +484,15 @@ def compare_result_frames(
             _canonical_sort(expected.iloc[:last_start]),
             abs_tolerances,
         )
-        tail_abs_tolerances = [abs_tolerances[i] for i in sort_col_indices] if abs_tolerances else None
+        # Only the ORDER BY values of the tail are compared, so project before
+        # sorting rather than canonical-sorting every column of the tail.
+        # De-duplicate positions: two ORDER BY keys can resolve to the same
+        # column, and repeated labels would break sort_values.
+        tail_cols = list(dict.fromkeys(sort_col_indices))
+        tail_abs_tolerances = [abs_tolerances[i] for i in tail_cols] if abs_tolerances else None
         _assert_frames_equal(
-            _canonical_sort(actual.iloc[last_start:]).iloc[:, sort_col_indices],
-            _canonical_sort(expected.iloc[last_start:]).iloc[:, sort_col_indices],
+            _canonical_sort(actual.iloc[last_start:, tail_cols]),
+            _canonical_sort(expected.iloc[last_start:, tail_cols]),
             tail_abs_tolerances,
         )
         return
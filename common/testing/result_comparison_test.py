@@ -13,9 +13,28 @@ from common.testing.result_comparison import (
     _canonical_sort,
     _find_last_tie_start,
     _normalize_to_expected,
+    _parse_query,
     _validate_orderby,
+    compare_result_frames,
+    get_limit,
+    get_orderby_col_indices,
 )
 
+# ---------------------------------------------------------------------------
+# SQL parsing helpers
+# ---------------------------------------------------------------------------
+
+
+def test_orderby_and_limit_share_one_parse():
+    query = "SELECT a, b FROM t ORDER BY b DESC, 1 LIMIT 10"
+    _parse_query.cache_clear()
+    assert get_orderby_col_indices(query, ["a", "b"]) == ([1, 0], [False, True])
+    assert get_limit(query) == 10
+    cache_info = _parse_query.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
 # ---------------------------------------------------------------------------
 # _normalize_to_expected
 # ---------------------------------------------------------------------------
@@ -203,3 +222,34 @@ def test_find_last_tie_start_multi_column():
     # Tie requires all ORDER BY columns to match.
     df = pd.DataFrame({0: [1, 1, 2, 2], 1: [10, 20, 30, 30]})
     assert _find_last_tie_start(df) == 2
+
+
+# ---------------------------------------------------------------------------
+# compare_result_frames
+# ---------------------------------------------------------------------------
+
+
+def test_compare_result_frames_limit_tail_compares_orderby_values_only():
+    # Rows tied on the ORDER BY column at the LIMIT cutoff may be picked
+    # differently by each engine; only their ORDER BY values must agree.
+    query = "SELECT name, total FROM t ORDER BY total DESC LIMIT 3"
+    actual = pd.DataFrame({"name": ["a", "c", "b"], "total": [10, 5, 5]})
+    expected = pd.DataFrame({"name": ["a", "d", "e"], "total": [10, 5, 5]})
+    compare_result_frames(actual, expected, query)
+
+
+def test_compare_result_frames_limit_tail_repeated_orderby_key():
+    # Two ORDER BY keys resolve to the same column; the tail projection must
+    # not produce duplicate column labels.
+    query = "SELECT name, total FROM t ORDER BY total DESC, 2 LIMIT 3"
+    actual = pd.DataFrame({"name": ["a", "c", "b"], "total": [10, 5, 5]})
+    expected = pd.DataFrame({"name": ["a", "d", "e"], "total": [10, 5, 5]})
+    compare_result_frames(actual, expected, query)
+
+
+def test_compare_result_frames_limit_tail_value_mismatch_raises():
+    query = "SELECT name, total FROM t ORDER BY total DESC LIMIT 3"
+    actual = pd.DataFrame({"name": ["a", "b", "c"], "total": [10, 5, 4]})
+    expected = pd.DataFrame({"name": ["a", "b", "c"], "total": [10, 5, 3]})
+    with pytest.raises(AssertionError, match="mismatch"):
+        compare_result_frames(actual, expected, query)
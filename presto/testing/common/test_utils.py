@@ -12,20 +12,32 @@ from common.testing.test_utils import (
     get_scale_factor_from_file,
 )
 
+_TEST_LOCATION_RE = re.compile(r"external_location = 'file:/var/lib/presto/data/hive/data/integration_test/(.*)'")
+_USER_LOCATION_RE = re.compile(r"external_location = 'file:/var/lib/presto/data/hive/data/user_data/(.*)'")
+
+# External locations resolved so far, keyed by (schema_name, table). Both the table setup fixture and
+# get_scale_factor look up the same tables, so this avoids repeating SHOW CREATE TABLE round-trips.
+_table_external_locations = {}
+
 
 def get_table_external_location(schema_name, table, presto_cursor):
+    key = (schema_name, table)
+    if key not in _table_external_locations:
+        _table_external_locations[key] = _fetch_table_external_location(schema_name, table, presto_cursor)
+    return _table_external_locations[key]
+
+
+def _fetch_table_external_location(schema_name, table, presto_cursor):
     create_table_text = presto_cursor.execute(f"SHOW CREATE TABLE hive.{schema_name}.{table}").fetchone()
-    test_pattern = r"external_location = 'file:/var/lib/presto/data/hive/data/integration_test/(.*)'"
-    user_pattern = r"external_location = 'file:/var/lib/presto/data/hive/data/user_data/(.*)'"
     assert len(create_table_text) == 1
-    test_match = re.search(test_pattern, create_table_text[0])
+    test_match = _TEST_LOCATION_RE.search(create_table_text[0])
     external_dir = ""
     if test_match:
         external_dir = get_abs_file_path(
             __file__, f"../../../common/testing/integration_tests/data/{test_match.group(1)}"
         )
     else:
-        user_match = re.search(user_pattern, create_table_text[0])
+        user_match = _USER_LOCATION_RE.search(create_table_text[0])
         if user_match:
             external_dir = f"{os.environ['PRESTO_DATA_DIR']}/{user_match.group(1)}"
     if not os.path.isdir(external_dir):
@@ -1,23 +1,33 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import prestodb
 import pytest
 
 from ..common.test_utils import get_abs_file_path, get_table_external_location
 from . import create_hive_tables, test_utils
 
+# Upper bound on concurrent SHOW CREATE TABLE requests sent to the coordinator.
+MAX_METADATA_FETCH_WORKERS = 8
+
+
+def create_presto_cursor(config, schema):
+    hostname = config.getoption("--hostname")
+    port = config.getoption("--port")
+    user = config.getoption("--user")
+    conn = prestodb.dbapi.connect(host=hostname, port=port, user=user, catalog="hive", schema=schema)
+    return conn.cursor()
+
 
 @pytest.fixture(scope="module")
 def presto_cursor(request):
     benchmark_type = request.node.obj.BENCHMARK_TYPE
-    hostname = request.config.getoption("--hostname")
-    port = request.config.getoption("--port")
-    user = request.config.getoption("--user")
     schema = request.config.getoption("--schema-name")
     schema = schema if schema else f"{benchmark_type}_test"
-    conn = prestodb.dbapi.connect(host=hostname, port=port, user=user, catalog="hive", schema=schema)
-    return conn.cursor()
+    return create_presto_cursor(request.config, schema)
 
 
 @pytest.fixture(scope="module")
@@ -32,9 +42,20 @@ def setup_and_teardown(request, presto_cursor):
         data_sub_directory = f"integration_test/{benchmark_type}"
         create_hive_tables.create_tables(presto_cursor, schema_name, schemas_dir, data_sub_directory)
 
-    tables = presto_cursor.execute(f"SHOW TABLES in {schema_name}").fetchall()
-    for (table,) in tables:
-        location = get_table_external_location(schema_name, table, presto_cursor)
+    tables = [table for (table,) in presto_cursor.execute(f"SHOW TABLES in {schema_name}").fetchall()]
+
+    # prestodb cursors are not thread-safe, so each worker thread opens one cursor and reuses it.
+    worker_state = threading.local()
+
+    def get_location(table):
+        if not hasattr(worker_state, "cursor"):
+            worker_state.cursor = create_presto_cursor(request.config, schema_name)
+        return get_table_external_location(schema_name, table, worker_state.cursor)
+
+    with ThreadPoolExecutor(max_workers=MAX_METADATA_FETCH_WORKERS) as executor:
+        locations = list(executor.map(get_location, tables))
+
+    for table, location in zip(tables, locations):
         print(f"  {schema_name}.{table}: location={location}")
         if not request.config.getoption("--reference-results-dir"):
             test_utils.create_duckdb_table(table, location)
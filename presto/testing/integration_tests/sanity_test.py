@@ -2,14 +2,27 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import prestodb
+import pytest
 
 
-def test_simple_query():
-    conn = prestodb.dbapi.connect(host="localhost", port=8080, user="test_user", catalog="tpch", schema="sf1")
+@pytest.fixture(scope="session")
+def tpch_sf1_cursor(request):
+    conn = prestodb.dbapi.connect(
+        host=request.config.getoption("--hostname"),
+        port=request.config.getoption("--port"),
+        user=request.config.getoption("--user"),
+        catalog="tpch",
+        schema="sf1",
+    )
     cursor = conn.cursor()
+    yield cursor
+    cursor.close()
+    conn.close()
 
-    cursor.execute("select count(*) from customer")
-    rows = cursor.fetchall()
+
+def test_simple_query(tpch_sf1_cursor):
+    tpch_sf1_cursor.execute("select count(*) from customer")
+    rows = tpch_sf1_cursor.fetchall()
 
     assert len(rows) == 1
     assert len(rows[0]) == 1